@@ -8,16 +8,28 @@ License: MIT
 from tkinter import*
 import tkinter as tk
 import customtkinter as ctk
-import webbrowser
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
+import gzip
+import hashlib
+import time
+import tempfile
+import zlib
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Callable
+from logging.handlers import QueueHandler, QueueListener
+from datetime import date, datetime, timedelta
+from functools import lru_cache, partial
+from itertools import islice
+from typing import Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import threading
+from collections import OrderedDict, defaultdict
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from queue import Queue
 import sqlite3
 from pathlib import Path
@@ -42,27 +54,46 @@ class Config:
     API_BASE_URL = "https://jobsearch.api.jobtechdev.se/search"
     API_TIMEOUT = 10
     MAX_RESULTS = 100
+    MAX_CONCURRENT = 4
+    HTTP_POOL_CONNECTIONS = 10
+    HTTP_POOL_MAXSIZE = 20
     
     # Files & Directories
     APP_DIR = Path.home() / ".jobfinder_pro"
     DB_FILE = APP_DIR / "jobfinder.db"
     LOG_FILE = APP_DIR / "app.log"
+    LOG_LISTENER = None  # QueueListener started by setup_logging()
     CONFIG_FILE = APP_DIR / "config.json"
     CACHE_DIR = APP_DIR / "cache"
     
     # Limits
     MAX_HISTORY = 50
+    HISTORY_SHOWN = 15
     CACHE_EXPIRY_HOURS = 24
+    MEMORY_CACHE_SIZE = 128
+    MEMORY_CACHE_TTL = 600  # seconds
     MAX_FAVORITES = 100
     
     # UI
     WINDOW_WIDTH = 1400
     WINDOW_HEIGHT = 850
     SIDEBAR_WIDTH = 280
+    SAVED_JOBS_CHUNK = 20
+    PAGE_SIZE = 25
     MIN_WINDOW_WIDTH = 1000
     MIN_WINDOW_HEIGHT = 700
 
 
+# Icons used in labels and result cards
+ICON_SAVE = "💾"
+ICON_SEARCH = "🔍"
+ICON_PIN = "📍"
+ICON_BUILDING = "🏢"
+ICON_STATS = "📊"
+ICON_HISTORY = "📜"
+ICON_FILTER = "🔧"
+
+
 class JobStatus(Enum):
     """Job application status"""
     NEW = "new"
@@ -77,7 +108,11 @@ class JobStatus(Enum):
 # DATA MODELS
 # ============================================================================
 
-@dataclass
+# Shared stand-in for missing nested objects in API hits; never mutated
+_EMPTY: dict = {}
+
+
+@dataclass(slots=True)
 class Job:
     """Job data model"""
     id: str
@@ -97,23 +132,64 @@ class Job:
     
     @classmethod
     def from_api(cls, hit: dict) -> 'Job':
-        """Create Job from API response"""
+        """Create Job from API response; missing or null values get defaults"""
+        emp = hit.get('employer') or _EMPTY
+        loc = hit.get('workplace_address') or _EMPTY
+        desc = hit.get('description') or _EMPTY
+        etyp = hit.get('employment_type') or _EMPTY
+        wh = hit.get('working_hours_type') or _EMPTY
+        
         return cls(
-            id=hit.get('id', ''),
-            title=hit.get('headline', 'Utan titel'),
-            company=hit.get('employer', {}).get('name', 'Okänd arbetsgivare'),
-            location=hit.get('workplace_address', {}).get('municipality', 'Plats ej angiven'),
-            url=hit.get('webpage_url', ''),
-            published_date=hit.get('publication_date', ''),
-            deadline=hit.get('application_deadline', ''),
-            description=hit.get('description', {}).get('text', ''),
-            salary=hit.get('salary_description', ''),
-            employment_type=hit.get('employment_type', {}).get('label', ''),
-            working_hours=hit.get('working_hours_type', {}).get('label', '')
+            id=hit.get('id') or '',
+            title=hit.get('headline') or 'Utan titel',
+            company=emp.get('name') or 'Okänd arbetsgivare',
+            location=loc.get('municipality') or 'Plats ej angiven',
+            url=hit.get('webpage_url') or '',
+            published_date=hit.get('publication_date') or '',
+            deadline=hit.get('application_deadline') or '',
+            description=desc.get('text') or '',
+            salary=hit.get('salary_description') or '',
+            employment_type=etyp.get('label') or '',
+            working_hours=wh.get('label') or ''
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class SavedJobSummary:
+    """Summary columns of a saved job, as listed in the saved jobs panel"""
+    id: str
+    title: str
+    company: str
+    location: str
+    url: str
+
+
+class LazyJobList(Sequence):
+    """Read-only list of jobs built from raw API hits on first access"""
+    
+    def __init__(self, hits: List[dict]):
+        self._hits = hits
+        self._jobs: List[Optional[Job]] = [None] * len(hits)
+    
+    def __len__(self) -> int:
+        return len(self._hits)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._hits)))]
+        
+        job = self._jobs[index]
+        if job is None:
+            job = self._jobs[index] = Job.from_api(self._hits[index])
+        return job
+    
+    def page(self, n: int, size: Optional[int] = None) -> List[Job]:
+        """Get page n (0-based), building only the jobs on that page"""
+        size = size or Config.PAGE_SIZE
+        return self[n * size:(n + 1) * size]
+
+
+@dataclass(slots=True)
 class SearchQuery:
     """Search query data model"""
     query: str
@@ -133,14 +209,94 @@ class SearchQuery:
 class DatabaseManager:
     """Manages SQLite database operations"""
     
+    # Statement text is kept constant so sqlite3's statement cache is reused
+    _SQL_INSERT_HISTORY = """
+        INSERT INTO search_history (query, locations, filters)
+        VALUES (?, ?, ?)
+    """
+    
+    _SQL_SELECT_HISTORY = """
+        SELECT query, locations, MAX(timestamp) AS ts
+        FROM search_history
+        GROUP BY query, locations
+        ORDER BY ts DESC
+        LIMIT ?
+    """
+    
+    _SQL_UPSERT_JOB = """
+        INSERT INTO saved_jobs 
+        (job_id, title, company, location, url, status, notes, data)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(job_id) DO UPDATE SET
+            title = excluded.title,
+            company = excluded.company,
+            location = excluded.location,
+            url = excluded.url,
+            status = excluded.status,
+            notes = excluded.notes,
+            saved_date = excluded.saved_date,
+            data = excluded.data
+    """
+    
+    _SQL_SELECT_JOBS = """
+        SELECT job_id, title, company, location, url FROM saved_jobs 
+        ORDER BY saved_date DESC
+    """
+    
+    _SQL_SELECT_JOBS_STATUS = """
+        SELECT job_id, title, company, location, url FROM saved_jobs 
+        WHERE status = ?
+        ORDER BY saved_date DESC
+    """
+    
+    _SQL_DELETE_JOB = "DELETE FROM saved_jobs WHERE job_id = ?"
+    
     def __init__(self, db_path: Path):
         self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_database()
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._initialized = False
+    
+    def _ensure_init(self):
+        """Open the database on first use"""
+        if self._initialized:
+            return
+        
+        with self._lock:
+            if not self._initialized:
+                self._init_database()
+                self._initialized = True
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a new tuned connection"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        return conn
+    
+    def _conn(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            self._ensure_init()
+            conn = self._connect()
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
     
     def _init_database(self):
-        """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
+        """Initialize database file and tables"""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        conn = self._connect()
+        
+        # WAL is persistent and lets readers run alongside the writer thread
+        conn.execute("PRAGMA journal_mode=WAL")
+        
+        with conn:
             cursor = conn.cursor()
             
             # Search history table
@@ -184,28 +340,45 @@ class DatabaseManager:
                 )
             """)
             
-            conn.commit()
+            # Indexes for filtered and ordered reads
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_saved_jobs_status_date
+                ON saved_jobs(status, saved_date DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_history_ts
+                ON search_history(timestamp DESC)
+            """)
+        
+        conn.close()
+    
+    def close(self):
+        """Close all connections"""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+            self._local = threading.local()
+            self._initialized = False
     
     def save_search(self, query: SearchQuery):
         """Save search to history"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT INTO search_history (query, locations, filters)
-                VALUES (?, ?, ?)
-            """, (query.query, json.dumps(query.locations), json.dumps(query.filters)))
-            conn.commit()
+        self.save_searches([query])
+    
+    def save_searches(self, queries: List[SearchQuery]):
+        """Save several searches to history in a single transaction"""
+        rows = (
+            (q.query, json.dumps(q.locations), json.dumps(q.filters))
+            for q in queries
+        )
+        with self._conn() as conn:
+            conn.executemany(self._SQL_INSERT_HISTORY, rows)
     
     def get_search_history(self, limit: int = 50) -> List[Dict]:
         """Get search history"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._conn() as conn:
             cursor = conn.cursor()
-            cursor.execute("""
-                SELECT DISTINCT query, locations, timestamp 
-                FROM search_history 
-                ORDER BY timestamp DESC 
-                LIMIT ?
-            """, (limit,))
+            cursor.execute(self._SQL_SELECT_HISTORY, (limit,))
             
             return [
                 {
@@ -218,47 +391,79 @@ class DatabaseManager:
     
     def save_job(self, job: Job, status: JobStatus = JobStatus.SAVED, notes: str = ""):
         """Save job to favorites"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("""
-                INSERT OR REPLACE INTO saved_jobs 
-                (job_id, title, company, location, url, status, notes, data)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (job.id, job.title, job.company, job.location, job.url, 
-                  status.value, notes, json.dumps(job.to_dict())))
-            conn.commit()
-    
-    def get_saved_jobs(self, status: Optional[JobStatus] = None) -> List[Job]:
-        """Get saved jobs, optionally filtered by status"""
-        with sqlite3.connect(self.db_path) as conn:
+        self.save_jobs([job], status, notes)
+    
+    def save_jobs(self, jobs: List[Job], status: JobStatus = JobStatus.SAVED, notes: str = ""):
+        """Save several jobs to favorites in a single transaction"""
+        rows = (
+            (j.id, j.title, j.company, j.location, j.url,
+             status.value, notes, json.dumps(j.to_dict()))
+            for j in jobs
+        )
+        with self._conn() as conn:
+            conn.executemany(self._SQL_UPSERT_JOB, rows)
+    
+    def get_saved_jobs(self, status: Optional[JobStatus] = None) -> List[SavedJobSummary]:
+        """
+        Get saved jobs, optionally filtered by status
+        
+        Only the summary columns are read, so no per-row JSON is parsed.
+        """
+        with self._conn() as conn:
             cursor = conn.cursor()
             
             if status:
-                cursor.execute("""
-                    SELECT data FROM saved_jobs 
-                    WHERE status = ?
-                    ORDER BY saved_date DESC
-                """, (status.value,))
+                cursor.execute(self._SQL_SELECT_JOBS_STATUS, (status.value,))
             else:
-                cursor.execute("""
-                    SELECT data FROM saved_jobs 
-                    ORDER BY saved_date DESC
-                """)
+                cursor.execute(self._SQL_SELECT_JOBS)
             
-            return [Job(**json.loads(row[0])) for row in cursor.fetchall()]
+            return [
+                SavedJobSummary(*row) for row in cursor.fetchall()
+            ]
     
     def delete_job(self, job_id: str):
         """Delete saved job"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute("DELETE FROM saved_jobs WHERE job_id = ?", (job_id,))
-            conn.commit()
+        with self._conn() as conn:
+            conn.execute(self._SQL_DELETE_JOB, (job_id,))
 
 
 # ============================================================================
 # API CLIENT
 # ============================================================================
 
+# Filter values mapped to API parameter values
+_PERIOD_DAYS = {'idag': 0, '7dagar': 7, '30dagar': 30}
+_HOURS_MAP = {'heltid': 'heltid', 'deltid': 'deltid'}
+
+
+@lru_cache(maxsize=256)
+def _build_filter_params_cached(today_iso: str, frozen_filters: frozenset,
+                                locations: tuple) -> Dict:
+    """
+    Convert locations and filters to API parameters
+    
+    Cached per day, filter set and locations; the returned dict is shared
+    between callers and must not be mutated.
+    """
+    filters = dict(frozen_filters)
+    today = date.fromisoformat(today_iso)
+    params = {}
+    
+    if locations:
+        params['municipality'] = ','.join(locations)
+    
+    # Omfattning
+    if (hours := filters.get('omfattning')) in _HOURS_MAP:
+        params['working-hours-type'] = _HOURS_MAP[hours]
+    
+    # Publicerad
+    if (period := filters.get('publicerad')) in _PERIOD_DAYS:
+        days = _PERIOD_DAYS[period]
+        params['published-after'] = (today - timedelta(days=days)).isoformat()
+    
+    return params
+
+
 class JobAPIClient:
     """JobTech API client with error handling and caching"""
     
@@ -266,9 +471,31 @@ class JobAPIClient:
         self.base_url = Config.API_BASE_URL
         self.timeout = Config.API_TIMEOUT
         self.session = requests.Session()
+        self.session.headers.update({
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+            'User-Agent': 'JobFinderPro/4.0'
+        })
+        
+        # Keep warm connections to the API host and retry transient errors
+        adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Config.HTTP_POOL_MAXSIZE,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
+        
+        # Worker pool for non-blocking searches
+        self.executor = ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENT)
+        
         self.cache_dir = Config.CACHE_DIR
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
+        # Recent responses kept in memory in front of the disk cache
+        self._memory_cache: OrderedDict[str, Tuple[float, Dict]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
     
@@ -288,15 +515,22 @@ class JobAPIClient:
         """
         params = {
             'q': query,
-            'limit': limit or Config.MAX_RESULTS
+            'limit': limit or Config.MAX_RESULTS,
+            **self._filter_params_cached(filters, locations)
         }
         
-        if locations:
-            params['municipality'] = ','.join(locations)
+        cache_key = self._cache_key(params)
+        cached = self._memory_get(cache_key)
+        if cached is not None:
+            self.logger.info(f"Memory cache hit: {query} in {locations}")
+            return cached
         
-        # Apply filters to params
-        if filters:
-            params.update(self._build_filter_params(filters))
+        cache_path = self.cache_dir / f"{cache_key}.json.gz"
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            self.logger.info(f"Cache hit: {query} in {locations}")
+            self._memory_put(cache_key, cached)
+            return cached
         
         try:
             self.logger.info(f"Searching: {query} in {locations}")
@@ -310,6 +544,8 @@ class JobAPIClient:
             data = response.json()
             self.logger.info(f"Found {data.get('total', {}).get('value', 0)} results")
             
+            self._memory_put(cache_key, data)
+            self._write_cache(cache_path, data)
             return data
             
         except requests.RequestException as e:
@@ -319,29 +555,90 @@ class JobAPIClient:
             self.logger.error(f"Failed to parse API response: {e}")
             raise
     
-    def _build_filter_params(self, filters: Dict) -> Dict:
-        """Convert filters to API parameters"""
-        params = {}
-        
-        # Omfattning
-        if filters.get('omfattning') == 'heltid':
-            params['working-hours-type'] = 'heltid'
-        elif filters.get('omfattning') == 'deltid':
-            params['working-hours-type'] = 'deltid'
+    def search_async(self, query: str, locations: List[str] = None,
+                     filters: Dict = None, limit: int = None) -> Future:
+        """Run search() on the worker pool and return its Future"""
+        return self.executor.submit(self.search, query, locations, filters, limit)
+    
+    def _cache_key(self, params: Dict) -> str:
+        """Get cache key for a set of request parameters"""
+        return hashlib.blake2b(
+            json.dumps(params, sort_keys=True).encode(), digest_size=16
+        ).hexdigest()
+    
+    def _memory_get(self, key: str) -> Optional[Dict]:
+        """Return response from the in-memory cache if still fresh"""
+        with self._memory_lock:
+            entry = self._memory_cache.get(key)
+            if entry is None:
+                return None
+            
+            stored_at, data = entry
+            if time.monotonic() - stored_at >= Config.MEMORY_CACHE_TTL:
+                del self._memory_cache[key]
+                return None
+            
+            self._memory_cache.move_to_end(key)
+            return data
+    
+    def _memory_put(self, key: str, data: Dict):
+        """Store response in the in-memory cache, evicting the oldest entry"""
+        with self._memory_lock:
+            self._memory_cache[key] = (time.monotonic(), data)
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > Config.MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+    
+    def _read_cache(self, path: Path) -> Optional[Dict]:
+        """Return cached response if present and not expired"""
+        if not path.exists():
+            return None
         
-        # Publicerad
-        if filters.get('publicerad') != 'alla':
-            period = filters['publicerad']
-            if period == 'idag':
-                params['published-after'] = datetime.now().strftime('%Y-%m-%d')
-            elif period == '7dagar':
-                date = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-                params['published-after'] = date
-            elif period == '30dagar':
-                date = (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d')
-                params['published-after'] = date
+        try:
+            if time.time() - path.stat().st_mtime >= Config.CACHE_EXPIRY_HOURS * 3600:
+                return None
+            return json.loads(gzip.decompress(path.read_bytes()))
+        except (OSError, ValueError, EOFError, zlib.error) as e:
+            self.logger.warning(f"Removing unreadable cache file {path}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+    
+    def _write_cache(self, path: Path, data: Dict):
+        """Store response in the on-disk cache"""
+        self._prune_cache()
         
-        return params
+        # Write to a temp file first so a crash never leaves a partial entry
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(dir=self.cache_dir, suffix=".tmp",
+                                             delete=False) as tmp:
+                tmp_path = Path(tmp.name)
+                tmp.write(gzip.compress(json.dumps(data).encode()))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            self.logger.warning(f"Failed to write cache file {path}: {e}")
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+    
+    def _prune_cache(self):
+        """Delete expired cache entries and leftover temp files"""
+        cutoff = time.time() - Config.CACHE_EXPIRY_HOURS * 3600
+        for pattern in ("*.json.gz", "*.tmp"):
+            for path in self.cache_dir.glob(pattern):
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                except OSError:
+                    pass
+    
+    def _filter_params_cached(self, filters: Optional[Dict],
+                              locations: Optional[List[str]]) -> Dict:
+        """Convert locations and filters to API parameters"""
+        return _build_filter_params_cached(
+            date.today().isoformat(),
+            frozenset(filters.items()) if filters else frozenset(),
+            tuple(locations) if locations else ()
+        )
 
 
 # ============================================================================
@@ -352,13 +649,22 @@ def setup_logging():
     """Configure application logging"""
     Config.APP_DIR.mkdir(parents=True, exist_ok=True)
     
+    if Config.LOG_LISTENER is not None:
+        return
+    
+    # Records are queued by the calling thread and written by the listener
+    log_queue = Queue(-1)
+    Config.LOG_LISTENER = QueueListener(
+        log_queue,
+        logging.FileHandler(Config.LOG_FILE),
+        logging.StreamHandler()
+    )
+    Config.LOG_LISTENER.start()
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(Config.LOG_FILE),
-            logging.StreamHandler()
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
     
     # Reduce requests library verbosity
@@ -494,16 +800,76 @@ class FilterMenu(ctk.CTkScrollableFrame):
         self.logger.info("Watch feature activated")
 
 
+class JobCard(ctk.CTkFrame):
+    """Saved job card that can be reused for different jobs"""
+    
+    def __init__(self, parent, on_delete: Callable):
+        super().__init__(parent, fg_color="#f3f4f6", corner_radius=8)
+        self.on_delete = on_delete
+        self.job = None
+        
+        # Title
+        self.title_btn = ctk.CTkButton(
+            self, text="", fg_color="transparent", 
+            hover_color="#e5e7eb", anchor="w",
+            font=("Inter", 13, "bold"), text_color="#1f2937",
+            command=self.open_job
+        )
+        self.title_btn.pack(fill="x", padx=10, pady=(10, 5))
+        
+        # Company & location
+        self.info = ctk.CTkLabel(self, text="",
+                                font=("Inter", 10), text_color="#6b7280", anchor="w")
+        self.info.pack(fill="x", padx=10, pady=(0, 5))
+        
+        # Action buttons
+        btn_frame = ctk.CTkFrame(self, fg_color="transparent")
+        btn_frame.pack(fill="x", padx=10, pady=(5, 10))
+        
+        ctk.CTkButton(
+            btn_frame, text="🗑️ Ta bort", width=80, height=25,
+            fg_color="#dc2626", hover_color="#b91c1c",
+            command=self.delete_job
+        ).pack(side="right", padx=2)
+        
+        ctk.CTkButton(
+            btn_frame, text="🔗 Öppna", width=80, height=25,
+            fg_color=Config.THEME_COLOR, hover_color="#059669",
+            command=self.open_job
+        ).pack(side="right", padx=2)
+    
+    def set_job(self, job: SavedJobSummary):
+        """Show another job in this card"""
+        self.job = job
+        self.title_btn.configure(text=job.title)
+        self.info.configure(text=f"{ICON_BUILDING} {job.company} • {ICON_PIN} {job.location}")
+    
+    def open_job(self):
+        """Open job ad in browser"""
+        import webbrowser
+        webbrowser.open(self.job.url)
+    
+    def delete_job(self):
+        """Delete the shown job"""
+        self.on_delete(self.job.id)
+
+
 class SavedJobsPanel(ctk.CTkToplevel):
     """Panel for managing saved jobs"""
     
-    def __init__(self, parent, db_manager: DatabaseManager):
+    def __init__(self, parent, db_manager: DatabaseManager, queue_write: Callable):
         super().__init__(parent)
         self.db = db_manager
+        self.queue_write = queue_write
         self.title("Sparade Jobb")
         self.geometry("900x600")
         self.attributes("-topmost", True)
         
+        # Cards are recycled between reloads instead of rebuilt
+        self._card_pool: List[JobCard] = []
+        self._jobs_iter = iter(())
+        self._loaded = 0
+        
         self.setup_ui()
         self.load_jobs()
     
@@ -513,7 +879,7 @@ class SavedJobsPanel(ctk.CTkToplevel):
         header = ctk.CTkFrame(self, fg_color=Config.ACCENT_BLUE, height=60)
         header.pack(fill="x")
         
-        ctk.CTkLabel(header, text="💾 Sparade Jobb", 
+        ctk.CTkLabel(header, text=f"{ICON_SAVE} Sparade Jobb", 
                     font=("Inter", 20, "bold"), text_color="white").pack(pady=15)
         
         # Filter by status
@@ -534,68 +900,77 @@ class SavedJobsPanel(ctk.CTkToplevel):
         # Jobs list
         self.jobs_frame = ctk.CTkScrollableFrame(self)
         self.jobs_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        
+        self.empty_label = ctk.CTkLabel(self.jobs_frame, text="Inga sparade jobb",
+                                       font=("Inter", 14), text_color="gray")
+        
+        # Load more cards as the list is scrolled towards the bottom
+        self._set_scrollbar = self.jobs_frame._scrollbar.set
+        self.jobs_frame._parent_canvas.configure(yscrollcommand=self._on_jobs_scroll)
     
     def load_jobs(self):
         """Load and display saved jobs"""
-        for widget in self.jobs_frame.winfo_children():
-            widget.destroy()
-        
         status_filter = None if self.status_var.get() == 'all' else JobStatus(self.status_var.get())
         jobs = self.db.get_saved_jobs(status_filter)
         
-        if not jobs:
-            ctk.CTkLabel(self.jobs_frame, text="Inga sparade jobb",
-                        font=("Inter", 14), text_color="gray").pack(pady=50)
-            return
-        
-        for job in jobs:
-            self.create_job_card(job)
-    
-    def create_job_card(self, job: Job):
-        """Create job card"""
-        card = ctk.CTkFrame(self.jobs_frame, fg_color="#f3f4f6", corner_radius=8)
-        card.pack(fill="x", pady=5, padx=5)
-        
-        # Title
-        title_btn = ctk.CTkButton(
-            card, text=job.title, fg_color="transparent", 
-            hover_color="#e5e7eb", anchor="w",
-            font=("Inter", 13, "bold"), text_color="#1f2937",
-            command=lambda: webbrowser.open(job.url)
-        )
-        title_btn.pack(fill="x", padx=10, pady=(10, 5))
+        # Hide the list while cards change so Tk reflows only once
+        self.jobs_frame.pack_forget()
         
-        # Company & location
-        info = ctk.CTkLabel(card, text=f"🏢 {job.company} • 📍 {job.location}",
-                           font=("Inter", 10), text_color="#6b7280", anchor="w")
-        info.pack(fill="x", padx=10, pady=(0, 5))
+        if jobs:
+            self.empty_label.pack_forget()
+        else:
+            self.empty_label.pack(pady=50)
         
-        # Action buttons
-        btn_frame = ctk.CTkFrame(card, fg_color="transparent")
-        btn_frame.pack(fill="x", padx=10, pady=(5, 10))
+        self._jobs_iter = iter(jobs)
+        self._loaded = 0
+        self._load_more_jobs()
         
-        ctk.CTkButton(
-            btn_frame, text="🗑️ Ta bort", width=80, height=25,
-            fg_color="#dc2626", hover_color="#b91c1c",
-            command=lambda: self.delete_job(job.id)
-        ).pack(side="right", padx=2)
+        # Hide cards left over from a longer list
+        for card in self._card_pool[self._loaded:]:
+            card.pack_forget()
         
-        ctk.CTkButton(
-            btn_frame, text="🔗 Öppna", width=80, height=25,
-            fg_color=Config.THEME_COLOR, hover_color="#059669",
-            command=lambda: webbrowser.open(job.url)
-        ).pack(side="right", padx=2)
+        self.jobs_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        self.jobs_frame.update_idletasks()
+    
+    def _load_more_jobs(self):
+        """Show the next chunk of saved jobs"""
+        for job in islice(self._jobs_iter, Config.SAVED_JOBS_CHUNK):
+            if self._loaded < len(self._card_pool):
+                card = self._card_pool[self._loaded]
+            else:
+                card = JobCard(self.jobs_frame, self.delete_job)
+                self._card_pool.append(card)
+            card.set_job(job)
+            card.pack(fill="x", pady=5, padx=5)
+            self._loaded += 1
+    
+    def _on_jobs_scroll(self, first: str, last: str):
+        """Update scrollbar and load more jobs near the bottom"""
+        self._set_scrollbar(first, last)
+        if float(last) > 0.85:
+            self._load_more_jobs()
     
     def delete_job(self, job_id: str):
-        """Delete job"""
-        self.db.delete_job(job_id)
-        self.load_jobs()
+        """Delete job on the writer thread"""
+        self.queue_write(self.db.delete_job, job_id, on_done=self._on_job_deleted)
+    
+    def _on_job_deleted(self, error: Optional[Exception]):
+        """Reload the list once a delete has finished"""
+        if self.winfo_exists():
+            self.load_jobs()
 
 
 # ============================================================================
 # MAIN APPLICATION
 # ============================================================================
 
+# Fixed parts of a result card
+_SEP_LINE = "\n" + "─" * 80 + "\n"
+_COMPANY_PREFIX = ICON_BUILDING + " "
+_LOC_PREFIX = ICON_PIN + " "
+_SAVE_LABEL = ICON_SAVE + " Spara  "
+
+
 class JobFinderPro(ctk.CTk):
     """Main application class"""
     
@@ -611,11 +986,22 @@ class JobFinderPro(ctk.CTk):
         self.db = DatabaseManager(Config.DB_FILE)
         self.api = JobAPIClient()
         
+        # Database writes run in order on a background thread
+        self._write_q = Queue()
+        threading.Thread(target=self._db_writer, daemon=True).start()
+        
         # State
         self.selected_orts = []
         self.current_filters = {}
         self.all_jobs = []
         self.filter_visible = False
+        self._search_inflight = False
+        self._pending_after = None
+        
+        # Jobs currently listed and how many of them have been rendered
+        self._shown_jobs = LazyJobList([])
+        self._rendered = 0
+        self._line_to_job: Dict[int, Job] = {}
         
         # Setup window
         self.title("JobFinder Pro v4.0 - Enterprise Edition          By Waleed Abo Hasan")
@@ -629,7 +1015,9 @@ class JobFinderPro(ctk.CTk):
 
         # Build UI
         self.setup_ui()
-        self.load_history()
+        
+        # Load history after the first frame is painted
+        self.after(50, self.load_history)
         
         self.logger.info("Application initialized successfully")
     
@@ -659,7 +1047,7 @@ class JobFinderPro(ctk.CTk):
         
         # Saved jobs button
         ctk.CTkButton(
-            sidebar, text="💾 Sparade Jobb", 
+            sidebar, text=f"{ICON_SAVE} Sparade Jobb", 
             fg_color=Config.THEME_COLOR, hover_color="#059669",
             height=40, font=("Inter", 12, "bold"),
             command=self.open_saved_jobs
@@ -667,19 +1055,35 @@ class JobFinderPro(ctk.CTk):
         
         # Statistics button
         ctk.CTkButton(
-            sidebar, text="📊 Statistik", 
+            sidebar, text=f"{ICON_STATS} Statistik", 
             fg_color="#3b82f6", hover_color="#2563eb",
             height=40, font=("Inter", 12, "bold"),
             command=self.show_statistics
         ).pack(fill="x", padx=15, pady=(0, 20))
         
         # History
-        ctk.CTkLabel(sidebar, text="📜 Tidigare Sökningar",
+        ctk.CTkLabel(sidebar, text=f"{ICON_HISTORY} Tidigare Sökningar",
                     font=("Inter", 14, "bold"), 
                     text_color=Config.THEME_COLOR).pack(pady=(0, 10))
         
         self.history_frame = ctk.CTkScrollableFrame(sidebar, fg_color="transparent")
         self.history_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
+        
+        # History widgets are created once and reconfigured on refresh
+        self.history_empty_label = ctk.CTkLabel(
+            self.history_frame, text="Ingen historik",
+            text_color=Config.TEXT_SECONDARY,
+            font=("Inter", 10, "italic")
+        )
+        self.history_buttons = [
+            ctk.CTkButton(
+                self.history_frame, text="",
+                fg_color="transparent", anchor="w",
+                text_color=Config.TEXT_SECONDARY, hover_color="#1E293B",
+                font=("Inter", 10)
+            )
+            for _ in range(Config.HISTORY_SHOWN)
+        ]
     
     def setup_main_content(self):
         """Setup main content area"""
@@ -710,7 +1114,7 @@ class JobFinderPro(ctk.CTk):
         
         # Location button
         self.btn_ort = ctk.CTkButton(
-            search_bar, text="📍 Välj Ort",
+            search_bar, text=f"{ICON_PIN} Välj Ort",
             fg_color="#1E293B", hover_color="#334155",
             width=150, height=45, corner_radius=10,
             font=("Inter", 12, "bold"),
@@ -720,16 +1124,16 @@ class JobFinderPro(ctk.CTk):
         
         # Search entry
         self.entry_yrke = ctk.CTkEntry(
-            search_bar, placeholder_text="🔍 Vad vill du jobba som?",
+            search_bar, placeholder_text=f"{ICON_SEARCH} Vad vill du jobba som?",
             height=45, fg_color="#1E293B", border_color="#334155",
             corner_radius=10, font=("Inter", 12)
         )
         self.entry_yrke.pack(side="left", fill="x", expand=True, padx=5)
-        self.entry_yrke.bind("<Return>", lambda e: self.start_search())
+        self.entry_yrke.bind("<Return>", self._schedule_search)
         
         # Filter toggle
         self.btn_filter = ctk.CTkButton(
-            search_bar, text="🔧 Filter",
+            search_bar, text=f"{ICON_FILTER} Filter",
             fg_color="#3b82f6", hover_color="#2563eb",
             width=100, height=45, corner_radius=10,
             font=("Inter", 12, "bold"),
@@ -739,7 +1143,7 @@ class JobFinderPro(ctk.CTk):
         
         # Search button
         self.btn_sok = ctk.CTkButton(
-            search_bar, text="🔍 Sök Jobb",
+            search_bar, text=f"{ICON_SEARCH} Sök Jobb",
             fg_color=Config.THEME_COLOR, hover_color="#059669",
             width=120, height=45, corner_radius=10,
             font=("Inter", 13, "bold"),
@@ -772,20 +1176,44 @@ class JobFinderPro(ctk.CTk):
             results_container, wrap="word", bg=Config.BG_MAIN,
             fg=Config.TEXT_PRIMARY, font=("Segoe UI", 11),
             padx=20, pady=20, borderwidth=0,
-            highlightthickness=0, cursor="arrow"
+            highlightthickness=0, cursor="arrow", state="disabled"
         )
         self.results_area.grid(row=1, column=0, sticky="nsew")
         
+        # Configure tags
+        self.results_area.tag_config("link", foreground=Config.THEME_COLOR, 
+                                    font=("Segoe UI", 13, "bold"), underline=True)
+        self.results_area.tag_config("company", foreground="#3b82f6", 
+                                    font=("Segoe UI", 11))
+        self.results_area.tag_config("location", foreground="#8b5cf6", 
+                                    font=("Segoe UI", 11))
+        self.results_area.tag_config("save_btn", foreground=Config.THEME_COLOR,
+                                    font=("Segoe UI", 10, "bold"), underline=True)
+        
+        # Tcl 8.6 counts characters outside the BMP as two index positions
+        self._tk_surrogates = self.tk.call("string", "length", "\U0001F4BE") == 2
+        
+        # Card clicks are dispatched by line, so tags are bound only once
+        self.results_area.tag_bind("link", "<Button-1>", self._on_title_click)
+        self.results_area.tag_bind("save_btn", "<Button-1>", self._on_save_click)
+        
+        for tag in ("link", "save_btn"):
+            self.results_area.tag_bind(tag, "<Enter>",
+                                      lambda e: self.results_area.config(cursor="hand2"))
+            self.results_area.tag_bind(tag, "<Leave>",
+                                      lambda e: self.results_area.config(cursor="arrow"))
+        
         # Scrollbar
-        scrollbar = ctk.CTkScrollbar(results_container, command=self.results_area.yview)
-        scrollbar.grid(row=1, column=1, sticky="ns")
-        self.results_area.configure(yscrollcommand=scrollbar.set)
+        self.results_scrollbar = ctk.CTkScrollbar(results_container,
+                                                  command=self.results_area.yview)
+        self.results_scrollbar.grid(row=1, column=1, sticky="ns")
+        self.results_area.configure(yscrollcommand=self._on_results_scroll)
     
     def toggle_filter(self):
         """Toggle filter panel visibility"""
         if self.filter_visible:
             self.filter_panel.grid_forget()
-            self.btn_filter.configure(text="🔧 Filter")
+            self.btn_filter.configure(text=f"{ICON_FILTER} Filter")
             self.filter_visible = False
         else:
             self.filter_panel.grid(row=0, column=0, sticky="nsew", padx=(0, 15))
@@ -794,12 +1222,15 @@ class JobFinderPro(ctk.CTk):
     
     def apply_filters(self, filters: Dict):
         """Apply filters to current results"""
+        if filters == self.current_filters:
+            return
+        
         self.current_filters = filters
         if self.all_jobs:
-            filtered = self.filter_jobs(self.all_jobs, filters)
+            filtered = self.filter_jobs(self.all_jobs, filters) if filters else self.all_jobs
             self.display_jobs(filtered)
     
-    def filter_jobs(self, jobs: List[Job], filters: Dict) -> List[Job]:
+    def filter_jobs(self, jobs: LazyJobList, filters: Dict) -> LazyJobList:
         """Filter jobs based on criteria"""
         filtered = jobs
         
@@ -809,56 +1240,78 @@ class JobFinderPro(ctk.CTk):
         return filtered
     
     def start_search(self):
-        """Start job search in background thread"""
+        """Start job search on the API worker pool"""
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+            self._pending_after = None
+        
+        if self._search_inflight:
+            return
+        
         query = self.entry_yrke.get().strip()
         if not query:
             self.logger.warning("Empty search query")
             return
         
+        self._search_inflight = True
+        
         # Show loading
-        self.results_area.delete(1.0, tk.END)
-        self.results_area.insert(tk.END, "🔍 Söker...\n")
-        self.stats_label.configure(text="⏳ Söker...")
-        self.btn_sok.configure(state="disabled", text="⏳ Söker...")
+        self._enter_loading()
+        
+        # Save to history
+        self.queue_write(self.db.save_search,
+                         SearchQuery(query, self.selected_orts, self.current_filters),
+                         on_done=self._on_search_saved)
         
         # Search in background
-        search_thread = threading.Thread(
-            target=self._search_worker,
-            args=(query, self.selected_orts, self.current_filters),
-            daemon=True
-        )
-        search_thread.start()
+        future = self.api.search_async(query, self.selected_orts, self.current_filters)
+        self.after(50, self._poll_search, future)
+    
+    def _on_search_saved(self, error: Optional[Exception]):
+        """Refresh history once the search has been recorded"""
+        if error is None:
+            self.load_history()
+    
+    def _enter_loading(self):
+        """Switch results, stats and search button to the loading state"""
+        self._clear_results()
+        self._write_results(f"{ICON_SEARCH} Söker...\n")
+        self.stats_label.configure(text="⏳ Söker...")
+        self.btn_sok.configure(state="disabled", text="⏳ Söker...")
     
-    def _search_worker(self, query: str, locations: List[str], filters: Dict):
-        """Background worker for search"""
+    def _schedule_search(self, event=None):
+        """Debounce Enter presses into a single search"""
+        if self._pending_after is not None:
+            self.after_cancel(self._pending_after)
+        self._pending_after = self.after(250, self.start_search)
+    
+    def _poll_search(self, future: Future):
+        """Wait for a background search without blocking the event loop"""
+        if not future.done():
+            self.after(50, self._poll_search, future)
+            return
+        
         try:
-            # Save to history
-            search_query = SearchQuery(query, locations, filters)
-            self.db.save_search(search_query)
-            
-            # API call
-            result = self.api.search(query, locations, filters)
+            result = future.result()
             hits = result.get('hits', [])
             total = result.get('total', {}).get('value', 0)
             
-            # Convert to Job objects
-            jobs = [Job.from_api(hit) for hit in hits]
+            # Job objects are built as cards are rendered
+            jobs = LazyJobList(hits)
             self.all_jobs = jobs
             
-            # Update UI in main thread
-            self.after(0, lambda: self._display_results(jobs, total))
+            self._display_results(jobs, total)
             
         except Exception as e:
             self.logger.error(f"Search failed: {e}", exc_info=True)
-            self.after(0, lambda: self._display_error(str(e)))
+            self._display_error(str(e))
         finally:
-            self.after(0, lambda: self.btn_sok.configure(
-                state="normal", text="🔍 Sök Jobb"
-            ))
+            self._search_inflight = False
+            self.btn_sok.configure(state="normal", text=f"{ICON_SEARCH} Sök Jobb")
     
-    def _display_results(self, jobs: List[Job], total: int):
+    def _display_results(self, jobs: LazyJobList, total: int):
         """Display search results"""
-        self.results_area.delete(1.0, tk.END)
+        self._clear_results()
         
         count = len(jobs)
         self.stats_label.configure(
@@ -867,106 +1320,200 @@ class JobFinderPro(ctk.CTk):
         )
         
         if count == 0:
-            self.results_area.insert(tk.END, "❌ Inga jobb hittades\n", "noresults")
+            self._write_results("❌ Inga jobb hittades\n", "noresults")
             return
         
-        for i, job in enumerate(jobs, 1):
-            self.add_job_card(i, job)
-        
-        self.load_history()  # Refresh history
+        # Cards are rendered a page at a time as the user scrolls
+        self._shown_jobs = jobs
+        self._render_more_results()
+        self.results_area.see("1.0")
+    
+    def _clear_results(self):
+        """Clear the results area and reset rendering state"""
+        self.results_area.configure(state="normal")
+        self.results_area.delete(1.0, tk.END)
+        self.results_area.configure(state="disabled")
+        self._shown_jobs = LazyJobList([])
+        self._rendered = 0
+        self._line_to_job.clear()
+    
+    def _render_more_results(self):
+        """Render the next page of job cards"""
+        page = self._shown_jobs.page(self._rendered // Config.PAGE_SIZE)
+        
+        # Build the page as plain text plus tag ranges
+        line = int(self.results_area.index("end-1c").split('.')[0])
+        parts: List[str] = []
+        spans: Dict[str, List[str]] = defaultdict(list)
+        for i, job in enumerate(page, self._rendered + 1):
+            self.add_job_card(i, job, line, parts, spans)
+            line += 4
+        
+        # The widget is read-only except while a whole page is inserted
+        self.results_area.configure(state="normal")
+        self.results_area.insert(tk.END, "".join(parts))
+        for tag, ranges in spans.items():
+            self.results_area.tag_add(tag, *ranges)
+        self.results_area.configure(state="disabled")
+        
+        self._rendered += len(page)
+    
+    def _write_results(self, text: str, *tags: str):
+        """Append a message to the read-only results area"""
+        self.results_area.configure(state="normal")
+        self.results_area.insert(tk.END, text, tags)
+        self.results_area.configure(state="disabled")
+    
+    def _on_results_scroll(self, first: str, last: str):
+        """Update scrollbar and render more cards near the bottom"""
+        self.results_scrollbar.set(first, last)
+        if float(last) > 0.85 and self._rendered < len(self._shown_jobs):
+            self._render_more_results()
     
     def _display_error(self, error: str):
         """Display error message"""
-        self.results_area.delete(1.0, tk.END)
-        self.results_area.insert(tk.END, f"❌ Fel: {error}\n", "error")
+        self._clear_results()
+        self._write_results(f"❌ Fel: {error}\n", "error")
         self.stats_label.configure(text="❌ Sökning misslyckades")
     
-    def add_job_card(self, index: int, job: Job):
-        """Add job card to results"""
-        # Separator
-        self.results_area.insert(tk.END, f"\n{'─' * 80}\n", "separator")
-        
-        # Index
-        self.results_area.insert(tk.END, f"#{index}  ", "index")
-        
-        # Title (clickable)
-        tag_name = f"link_{job.id}"
-        self.results_area.insert(tk.END, f"{job.title}\n", ("link", tag_name))
+    def add_job_card(self, index: int, job: Job, line: int,
+                     parts: List[str], spans: Dict[str, List[str]]):
+        """
+        Add job card text and tag ranges to a page being rendered
         
-        # Company & location
-        self.results_area.insert(tk.END, f"🏢 {job.company}", "company")
-        self.results_area.insert(tk.END, "  •  ", "separator_small")
-        self.results_area.insert(tk.END, f"📍 {job.location}\n", "location")
+        The card starts at the end of `line` and fills the four lines
+        below it: separator, index and title, company and location, and
+        the text-based save button.
+        """
+        title_line, info_line, save_line = line + 2, line + 3, line + 4
+        
+        # Title and save button lines of this card, for click dispatch
+        self._line_to_job[title_line] = job
+        self._line_to_job[save_line] = job
+        
+        # API text may contain line breaks; the card must stay four lines
+        index_label = f"#{index}  "
+        title = " ".join(job.title.split())
+        company = _COMPANY_PREFIX + " ".join(job.company.split())
+        location = " ".join(job.location.split())
+        parts.append(_SEP_LINE + index_label + title + "\n"
+                     + company + "  •  " + _LOC_PREFIX + location + "\n"
+                     + _SAVE_LABEL)
+        
+        n = len(index_label)
+        c = self._tk_len(company)
+        spans["separator"] += (f"{line + 1}.0", f"{line + 1}.end")
+        spans["index"] += (f"{title_line}.0", f"{title_line}.{n}")
+        spans["link"] += (f"{title_line}.{n}", f"{title_line}.end")
+        spans["company"] += (f"{info_line}.0", f"{info_line}.{c}")
+        spans["separator_small"] += (f"{info_line}.{c}", f"{info_line}.{c + 5}")
+        spans["location"] += (f"{info_line}.{c + 5}", f"{info_line}.end")
+        spans["save_btn"] += (f"{save_line}.0", f"{save_line}.end")
+    
+    def _tk_len(self, text: str) -> int:
+        """Length of text in Tk index units"""
+        if self._tk_surrogates:
+            return len(text.encode('utf-16-le')) // 2
+        return len(text)
+    
+    def _job_at(self, event) -> Optional[Job]:
+        """Get the job whose card is under the mouse"""
+        index = self.results_area.index(f"@{event.x},{event.y}")
+        return self._line_to_job.get(int(index.split('.')[0]))
+    
+    def _on_title_click(self, event):
+        """Open the clicked job in the browser"""
+        job = self._job_at(event)
+        if job:
+            import webbrowser
+            webbrowser.open(job.url)
+    
+    def _on_save_click(self, event):
+        """Save the clicked job"""
+        job = self._job_at(event)
+        if job:
+            self.save_job(job)
+    
+    def save_job(self, job: Job):
+        """Save job to favorites"""
+        self.queue_write(self.db.save_job, job,
+                         on_done=partial(self._on_job_saved, job))
+    
+    def _on_job_saved(self, job: Job, error: Optional[Exception]):
+        """Confirm a finished save, or report its failure"""
+        if error is None:
+            self.logger.info(f"Saved job: {job.title}")
+            title, text, color = "Sparat", "✅ Jobb sparat!", Config.THEME_COLOR
+        else:
+            self.logger.error(f"Failed to save job: {error}")
+            title, text, color = "Fel", "❌ Kunde inte spara jobbet", "#dc2626"
         
-        # Save button (text-based)
-        save_tag = f"save_{job.id}"
-        self.results_area.insert(tk.END, "💾 Spara  ", (save_tag, "save_btn"))
+        # Show confirmation
+        confirm = ctk.CTkToplevel(self)
+        confirm.title(title)
+        confirm.geometry("300x100")
+        confirm.attributes("-topmost", True)
         
-        # Configure tags
-        self.results_area.tag_config("link", foreground=Config.THEME_COLOR, 
-                                    font=("Segoe UI", 13, "bold"), underline=True)
-        self.results_area.tag_config("company", foreground="#3b82f6", 
-                                    font=("Segoe UI", 11))
-        self.results_area.tag_config("location", foreground="#8b5cf6", 
-                                    font=("Segoe UI", 11))
-        self.results_area.tag_config("save_btn", foreground=Config.THEME_COLOR,
-                                    font=("Segoe UI", 10, "bold"), underline=True)
+        ctk.CTkLabel(confirm, text=text, 
+                    font=("Inter", 14, "bold"),
+                    text_color=color).pack(pady=30)
         
-        # Bind events
-        self.results_area.tag_bind(tag_name, "<Button-1>", 
-                                  lambda e: webbrowser.open(job.url))
-        self.results_area.tag_bind(save_tag, "<Button-1>",
-                                  lambda e: self.save_job(job))
+        self.after(1500, confirm.destroy)
+    
+    def queue_write(self, fn: Callable, *args, on_done: Optional[Callable] = None) -> Future:
+        """
+        Queue a database write for the writer thread
         
-        for tag in [tag_name, save_tag]:
-            self.results_area.tag_bind(tag, "<Enter>",
-                                      lambda e: self.results_area.config(cursor="hand2"))
-            self.results_area.tag_bind(tag, "<Leave>",
-                                      lambda e: self.results_area.config(cursor="arrow"))
+        When on_done is given it is called on the Tk thread with the
+        exception raised by the write, or None.
+        """
+        future = Future()
+        self._write_q.put((fn, args, future))
+        if on_done is not None:
+            self.after(50, self._poll_write, future, on_done)
+        return future
     
-    def save_job(self, job: Job):
-        """Save job to favorites"""
-        try:
-            self.db.save_job(job)
-            self.logger.info(f"Saved job: {job.title}")
-            
-            # Show confirmation
-            confirm = ctk.CTkToplevel(self)
-            confirm.title("Sparat")
-            confirm.geometry("300x100")
-            confirm.attributes("-topmost", True)
-            
-            ctk.CTkLabel(confirm, text="✅ Jobb sparat!", 
-                        font=("Inter", 14, "bold"),
-                        text_color=Config.THEME_COLOR).pack(pady=30)
-            
-            self.after(1500, confirm.destroy)
-            
-        except Exception as e:
-            self.logger.error(f"Failed to save job: {e}")
+    def _poll_write(self, future: Future, on_done: Callable):
+        """Wait for a queued write without blocking the event loop"""
+        if not future.done():
+            self.after(50, self._poll_write, future, on_done)
+            return
+        on_done(future.exception())
+    
+    def _db_writer(self):
+        """Run queued database writes and resolve their futures"""
+        while True:
+            fn, args, future = self._write_q.get()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                self.logger.error(f"Database write failed: {e}", exc_info=True)
+                future.set_exception(e)
+            finally:
+                self._write_q.task_done()
+    
+    def shutdown(self):
+        """Stop background work, finish pending writes and close the database"""
+        self.api.executor.shutdown(wait=False, cancel_futures=True)
+        self._write_q.join()
+        self.db.close()
     
     def load_history(self):
         """Load and display search history"""
-        for widget in self.history_frame.winfo_children():
-            widget.destroy()
+        history = self.db.get_search_history(limit=len(self.history_buttons))
         
-        history = self.db.get_search_history(limit=15)
-        
-        if not history:
-            ctk.CTkLabel(self.history_frame, text="Ingen historik",
-                        text_color=Config.TEXT_SECONDARY,
-                        font=("Inter", 10, "italic")).pack(pady=10)
-            return
+        if history:
+            self.history_empty_label.pack_forget()
+        else:
+            self.history_empty_label.pack(pady=10)
         
-        for item in history:
-            btn = ctk.CTkButton(
-                self.history_frame, text=f"🔍 {item['query']}",
-                fg_color="transparent", anchor="w",
-                text_color=Config.TEXT_SECONDARY, hover_color="#1E293B",
-                font=("Inter", 10),
-                command=lambda q=item['query']: self.quick_search(q)
-            )
+        for btn, item in zip(self.history_buttons, history):
+            btn.configure(text=f"{ICON_SEARCH} {item['query']}",
+                          command=partial(self.quick_search, item['query']))
             btn.pack(fill="x", pady=2)
+        
+        for btn in self.history_buttons[len(history):]:
+            btn.pack_forget()
     
     def quick_search(self, query: str):
         """Quick search from history"""
@@ -981,14 +1528,14 @@ class JobFinderPro(ctk.CTk):
     
     def open_saved_jobs(self):
         """Open saved jobs panel"""
-        SavedJobsPanel(self, self.db)
+        SavedJobsPanel(self, self.db, self.queue_write)
     
     def show_statistics(self):
         """Show search statistics"""
         self.logger.info("Showing statistics")
         # Implement statistics view
     
-    def display_jobs(self, jobs: List[Job]):
+    def display_jobs(self, jobs: LazyJobList):
         """Display filtered jobs"""
         self._display_results(jobs, len(self.all_jobs))
 
@@ -1002,9 +1549,13 @@ def main():
     try:
         app = JobFinderPro()
         app.mainloop()
+        app.shutdown()
     except Exception as e:
         logging.error(f"Application crashed: {e}", exc_info=True)
         raise
+    finally:
+        if Config.LOG_LISTENER is not None:
+            Config.LOG_LISTENER.stop()
 
 
 if __name__ == "__main__":